@@ -1,16 +1,213 @@
-import secrets
+import asyncio
+import functools
+import os
+import ssl
 import string
-import requests
-import urllib3
+import time
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, ClassVar
+from urllib.parse import urlsplit
+
+# `requests` and `urllib3` are imported lazily where needed, so callers that
+# never touch the network do not pay their import cost.
+if TYPE_CHECKING:
+    import requests
+
+    # Cached index template download: the response (None after a failure)
+    # and the monotonic time at which the entry expires.
+    _TemplateEntry = tuple[requests.Response | None, float]
 
 
 CHARSET = string.ascii_letters + string.digits + "-_"
 
+# CHARSET has exactly 64 characters, so masking a random byte with 0x3F maps
+# it uniformly onto CHARSET. The 256-entry table lets `bytes.translate` do
+# the mapping for a whole buffer of random bytes in a single C-level pass.
+_CHARSET_BYTES = CHARSET.encode("ascii")
+_TABLE = bytes(_CHARSET_BYTES[b & 0x3F] for b in range(256))
+
+# Status codes indicating that a server does not handle HEAD requests, in
+# which case `url_exists` retries with a GET.
+_HEAD_UNSUPPORTED = frozenset({405, 501})
+
+# Seconds for which `url_exists` treats a host as unreachable after failing to
+# connect to it, instead of waiting on the full timeout again for every slug.
+_DEAD_HOST_TTL = 30.0
+
+# Seconds for which a failed index template download is remembered, so that a
+# batch of `create(with_index=True)` calls does not retry it for every slug.
+_TEMPLATE_FAILURE_TTL = 30.0
+
+# Number of slugs `make_slug_unique` draws before giving up, which only
+# happens when nearly every slug of the requested length is already in use.
+_MAX_SLUG_ATTEMPTS = 100
+
+
+def _make_slug(length: int, _urandom=os.urandom, _table=_TABLE) -> str:
+    """
+    Generate a random slug of `length` characters drawn from `CHARSET`.
+
+    Module-level so that `functools.partial` objects bound to it, as used for
+    `DataDistributor`'s per-instance slug generator, can be pickled. The
+    `_urandom` and `_table` arguments bind those lookups as locals and are
+    not meant to be passed.
+    """
+    return _urandom(length).translate(_table).decode("ascii")
+
+
+@functools.cache
+def _pooled_adapter_class() -> type:
+    """
+    Return the `HTTPAdapter` subclass used by `DataDistributor` sessions.
+
+    The class is defined on first use so that `requests` is only imported
+    when a network request is actually made. It shares one process-wide TLS
+    context for requests made with ``verify=True``, so the CA bundle is parsed
+    once rather than for every new connection pool or session, and another
+    for requests made with ``verify=False``, so an unverified context is not
+    rebuilt for every connection. A CA bundle path or client certificate is
+    handled by the default `requests` logic.
+    """
+    from requests.adapters import HTTPAdapter
+    from requests.utils import DEFAULT_CA_BUNDLE_PATH
+
+    ssl_context = ssl.create_default_context(cafile=DEFAULT_CA_BUNDLE_PATH)
+
+    insecure_ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    insecure_ssl_context.check_hostname = False
+    insecure_ssl_context.verify_mode = ssl.CERT_NONE
+
+    class _PooledHTTPAdapter(HTTPAdapter):
+        def build_connection_pool_key_attributes(
+            self,
+            request,
+            verify,
+            cert=None,
+        ):
+            host_params, pool_kwargs = (
+                super().build_connection_pool_key_attributes(
+                    request, verify, cert
+                )
+            )
+            if cert is None:
+                if verify is True:
+                    pool_kwargs["ssl_context"] = ssl_context
+                elif verify is False:
+                    pool_kwargs["ssl_context"] = insecure_ssl_context
+            return host_params, pool_kwargs
+
+        def cert_verify(self, conn, url, verify, cert):
+            super().cert_verify(conn, url, verify, cert)
+            # The shared context already holds the default CA bundle; leaving
+            # `ca_certs` set would make urllib3 load it again into that
+            # context for every new connection.
+            if (
+                verify is True
+                and cert is None
+                and url.lower().startswith("https")
+            ):
+                conn.ca_certs = None
+                conn.ca_cert_dir = None
+
+    return _PooledHTTPAdapter
+
+
+def _new_session() -> "requests.Session":
+    """
+    Create a `requests.Session` with pooled connections for HTTP and HTTPS.
+
+    Returns
+    -------
+    requests.Session
+        A new session using the adapter from `_pooled_adapter_class`.
+    """
+    import requests
+
+    session = requests.Session()
+    adapter = _pooled_adapter_class()(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Constant parts of the fallback `index.html` stub, pre-encoded so that only
+# the title and body need encoding when a stub is built.
+_HTML_PREFIX = (
+    b'<!DOCTYPE html>\n'
+    b'<html lang="en">\n'
+    b'  <head>\n'
+    b'    <meta charset="utf-8">\n'
+    b'    <meta name="robots" content="noindex, nofollow">\n'
+    b'    <title>'
+)
+_HTML_MID = b'</title>\n  </head>\n  <body>\n'
+_HTML_SUFFIX = b'\n  </body>\n</html>\n'
+
+
+def _fallback_index_html(
+    title: str | None = None,
+    body_html: str | None = None,
+) -> bytes:
+    """
+    Build the fallback `index.html` stub used when no template is available.
+
+    Parameters
+    ----------
+    title : str or None, optional
+        Text for the `<title>` element. Defaults to "Data".
+    body_html : str or None, optional
+        Content for the `<body>` element. Defaults to a placeholder message.
+
+    Returns
+    -------
+    bytes
+        The complete HTML document, UTF-8 encoded.
+    """
+    title = title or "Data"
+    body_html = body_html or (
+        "<h1>Data Placeholder</h1>\n"
+        "<p>This page was automatically generated.</p>\n"
+    )
+    return b"".join((
+        _HTML_PREFIX,
+        title.encode("utf-8"),
+        _HTML_MID,
+        body_html.encode("utf-8"),
+        _HTML_SUFFIX,
+    ))
+
+
+# The default stub never changes, so it is rendered and encoded only once.
+_DEFAULT_INDEX_HTML = _fallback_index_html()
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write `data` to `path`, creating or truncating the file.
+
+    Uses a raw file descriptor rather than a buffered file object, which
+    avoids the text-layer and buffering overhead for small files.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Destination file.
+    data : bytes
+        Content to write.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataDistributor:
     """
     Create random slug-based directories for web-visible data distributions.
@@ -52,6 +249,25 @@ class DataDistributor:
     slug_length: int = 32
     suppress_insecure_warning: bool = False
 
+    # Internal state populated by `__post_init__`; excluded from the
+    # constructor, repr, and comparisons.
+    _template_cache: "dict[tuple[str, bool | str], _TemplateEntry]" = field(
+        init=False, repr=False, compare=False
+    )
+    _session: "requests.Session | None" = field(
+        init=False, repr=False, compare=False
+    )
+    _netloc: str = field(init=False, repr=False, compare=False)
+    _url_prefix: str = field(init=False, repr=False, compare=False)
+    _known_slugs: set[str] = field(init=False, repr=False, compare=False)
+    _make_slug_fast: Callable[[], str] = field(
+        init=False, repr=False, compare=False
+    )
+
+    # Monotonic deadlines, keyed by network location, until which hosts that
+    # recently failed a `url_exists` request are reported as unreachable.
+    _host_dead_until: ClassVar[dict[str, float]] = {}
+
     def __post_init__(self) -> None:
         """
         Normalize and finalize dataclass attributes after initialization.
@@ -60,6 +276,15 @@ class DataDistributor:
         strips any trailing slash from `base_url` and `index_template_url`.
         If `suppress_insecure_warning` is True, it disables
         `urllib3`'s `InsecureRequestWarning` globally in the current process.
+        It also attaches an empty per-instance cache for downloaded index
+        templates and a slot for the pooled `requests.Session` shared by all
+        network calls, which is created on first use, and records the network
+        location of `base_url` and the URL prefix shared by all slugs.
+        Finally, `base_directory` is created (with any missing parents) if it
+        does not already exist, and the names of the slug directories already
+        present in it are loaded into an in-memory set used to avoid slug
+        collisions. A variant of `make_slug` specialized to `slug_length` is
+        also built for the common case where no length override is given.
         """
         object.__setattr__(self, "base_directory", Path(self.base_directory))
         object.__setattr__(self, "base_url", self.base_url.rstrip("/"))
@@ -72,17 +297,79 @@ class DataDistributor:
             )
 
         if self.suppress_insecure_warning:
+            import urllib3
+
             urllib3.disable_warnings(
                 urllib3.exceptions.InsecureRequestWarning
             )
 
-    def make_slug(self, length: int | None = None) -> str:
+        object.__setattr__(self, "_template_cache", {})
+        object.__setattr__(self, "_session", None)
+        object.__setattr__(self, "_netloc", urlsplit(self.base_url).netloc)
+        object.__setattr__(self, "_url_prefix", self.base_url + "/")
+
+        self.base_directory.mkdir(parents=True, exist_ok=True)
+        with os.scandir(self.base_directory) as entries:
+            known_slugs = {entry.name for entry in entries if entry.is_dir()}
+        object.__setattr__(self, "_known_slugs", known_slugs)
+
+        object.__setattr__(
+            self,
+            "_make_slug_fast",
+            functools.partial(_make_slug, self.slug_length),
+        )
+
+    def __reduce__(self):
+        """
+        Pickle and copy instances by their constructor arguments only.
+
+        The internal state (HTTP session, template cache, known slugs) is
+        rebuilt by `__post_init__` rather than being serialized or copied.
+        """
+        return (
+            type(self),
+            (
+                self.base_directory,
+                self.base_url,
+                self.index_template_url,
+                self.slug_length,
+                self.suppress_insecure_warning,
+            ),
+        )
+
+    def _http(self) -> "requests.Session":
+        """
+        Return the instance's pooled HTTP session, creating it if needed.
+        """
+        if self._session is None:
+            object.__setattr__(self, "_session", _new_session())
+        return self._session
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and release pooled connections.
+
+        A new session is created if the instance makes further requests.
+        """
+        if self._session is not None:
+            self._session.close()
+            object.__setattr__(self, "_session", None)
+
+    def make_slug(
+        self,
+        length: int | None = None,
+        _urandom=os.urandom,
+        _table=_TABLE,
+    ) -> str:
         """
         Generate a random alpha/numeric/symbol slug with URL-safe characters.
 
         The slug is composed of ASCII letters, digits, and valid symbols.
         If `length` is not provided, the instance attribute `slug_length`
-        is used.
+        is used. A single buffer of cryptographically secure random bytes
+        is drawn from `os.urandom` (the source behind `secrets`) and each
+        byte is mapped onto `CHARSET`. The `_urandom` and `_table` arguments
+        bind those lookups as locals and are not meant to be passed.
 
         Parameters
         ----------
@@ -96,14 +383,59 @@ class DataDistributor:
         """
         if length is None:
             length = self.slug_length
-        return ''.join(secrets.choice(CHARSET) for _ in range(length))
+        return _urandom(length).translate(_table).decode("ascii")
+
+    def make_slug_unique(self, length: int | None = None) -> str:
+        """
+        Generate a random slug that is not already in use.
+
+        Slugs are drawn with `make_slug` until one is found that does not
+        match an existing slug directory in `base_directory`. The check is
+        made against an in-memory set loaded at initialization, so no
+        filesystem access is needed. The returned slug is added to that set,
+        which is maintained only by this method.
+        When `length` is None, the instance's specialized slug generator for
+        `slug_length` is used.
+
+        Parameters
+        ----------
+        length : int or None, optional
+            Length of the slug. If None, `self.slug_length` is used.
+
+        Returns
+        -------
+        str
+            A randomly generated slug not previously known to this instance.
+
+        Raises
+        ------
+        FileExistsError
+            If no unused slug is found within a bounded number of attempts,
+            e.g. when every slug of the requested length already exists.
+        """
+        if length is None:
+            make_slug = self._make_slug_fast
+        else:
+            make_slug = functools.partial(self.make_slug, length)
+
+        for _ in range(_MAX_SLUG_ATTEMPTS):
+            slug = make_slug()
+            if slug not in self._known_slugs:
+                self._known_slugs.add(slug)
+                return slug
+
+        raise FileExistsError(
+            f"no unused slug found in {self.base_directory} after "
+            f"{_MAX_SLUG_ATTEMPTS} attempts"
+        )
 
     def create_data_dir(self, slug: str) -> Path:
         """
         Create a data directory for a given slug.
 
         The directory is created as a subdirectory of `base_directory` with
-        the name equal to the provided slug.
+        the name equal to the provided slug. Since `base_directory` is created
+        during initialization, this is a single `mkdir` system call.
 
         Parameters
         ----------
@@ -118,11 +450,10 @@ class DataDistributor:
         Raises
         ------
         FileExistsError
-            If the directory already exists and cannot be created with
-            `exist_ok=False`.
+            If the directory already exists.
         """
         path = self.base_directory / slug
-        path.mkdir(parents=True, exist_ok=False)
+        os.mkdir(path)
         return path
 
     def create_data_url(self, slug: str) -> str:
@@ -140,7 +471,94 @@ class DataDistributor:
             Full URL for the given slug, formed by combining `base_url`
             and the slug.
         """
-        return f"{self.base_url}/{slug}"
+        return self._url_prefix + slug
+
+    def _fetch_index_template(
+        self,
+        verify: bool | str | None = None
+    ) -> "requests.Response | None":
+        """
+        Download `index_template_url`, or return the cached result.
+
+        Returns ``None`` if the URL is not configured or the request fails.
+        Cache entries are ``(response, expires_at)`` pairs on the monotonic
+        clock: successful responses never expire, while failures are stored
+        as ``None`` for `_TEMPLATE_FAILURE_TTL` seconds before a retry.
+        """
+        if not self.index_template_url:
+            return None
+
+        if verify is None:
+            verify = True
+
+        key = (self.index_template_url, verify)
+        cached = self._template_cache.get(key)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        import requests
+
+        try:
+            response = self._http().get(
+                self.index_template_url,
+                timeout=5,
+                verify=verify,
+            )
+            response.raise_for_status()
+        except requests.RequestException:
+            self._template_cache[key] = (
+                None, time.monotonic() + _TEMPLATE_FAILURE_TTL
+            )
+            return None
+
+        self._template_cache[key] = (response, float("inf"))
+        return response
+
+    def read_index_template_bytes(
+        self,
+        verify: bool | str | None = None
+    ) -> bytes | None:
+        """
+        Retrieve the raw HTML template bytes from `index_template_url`.
+
+        This method attempts to download the template specified by
+        `index_template_url` using an HTTP GET request. If the URL is
+        not configured, if the request fails, or if a non-successful
+        HTTP status is returned, the method returns ``None``.
+
+        Parameters
+        ----------
+        verify : bool or str or None, optional
+            SSL certificate verification setting passed to the HTTP GET:
+            - If ``True``, system CA certificates are used.
+            - If ``False``, SSL verification is disabled (insecure).
+            - If a string, it is treated as a path to a CA bundle.
+            - If ``None`` (the default), this method treats it as ``True``,
+              matching the default behavior of ``requests``.
+
+        Returns
+        -------
+        bytes or None
+            The template body exactly as served if successfully retrieved;
+            otherwise ``None``.
+
+        Notes
+        -----
+        The request is issued through the instance's pooled session, so
+        connections to the same host are reused. A timeout of 5 seconds is
+        used. All network- and HTTP-related exceptions are caught and result
+        in ``None`` being returned.
+
+        Successfully retrieved templates are cached on the instance, keyed by
+        template URL and `verify` setting, so repeated calls (e.g. from
+        `create(with_index=True)` in a loop) download the template only once.
+        A failure is also remembered, for 30 seconds, during which ``None``
+        is returned without issuing a request.
+        """
+        response = self._fetch_index_template(verify=verify)
+        if response is None:
+            return None
+        return response.content
 
     def read_index_template(
         self,
@@ -157,7 +575,7 @@ class DataDistributor:
         Parameters
         ----------
         verify : bool or str or None, optional
-            SSL certificate verification setting passed to ``requests.get``:
+            SSL certificate verification setting passed to the HTTP GET:
             - If ``True``, system CA certificates are used.
             - If ``False``, SSL verification is disabled (insecure).
             - If a string, it is treated as a path to a CA bundle.
@@ -168,30 +586,52 @@ class DataDistributor:
         -------
         str or None
             The template HTML as a string if successfully retrieved; otherwise
-            ``None``.
+            ``None``. The body is decoded by ``requests`` using the charset
+            from the response headers, or a detected one if none is given.
 
         Notes
         -----
-        A timeout of 5 seconds is used. All network- and HTTP-related
-        exceptions are caught and result in ``None`` being returned.
+        The request is issued through the instance's pooled session, so
+        connections to the same host are reused. A timeout of 5 seconds is
+        used. All network- and HTTP-related exceptions are caught and result
+        in ``None`` being returned.
+
+        Successfully retrieved templates are cached on the instance, keyed by
+        template URL and `verify` setting, so repeated calls (e.g. from
+        `create(with_index=True)` in a loop) download the template only once.
+        A failure is also remembered, for 30 seconds, during which ``None``
+        is returned without issuing a request.
         """
-        if not self.index_template_url:
+        response = self._fetch_index_template(verify=verify)
+        if response is None:
             return None
+        return response.text
 
-        if verify is None:
-            verify = True
+    def _index_html(
+        self,
+        title: str | None = None,
+        body_html: str | None = None,
+        verify: bool | str | None = None,
+    ) -> bytes:
+        """
+        Return the encoded contents for an `index.html` file.
 
-        try:
-            response = requests.get(
-                self.index_template_url,
-                timeout=5,
-                verify=verify,
-            )
-            response.raise_for_status()
-        except requests.RequestException:
-            return None
+        This is the remote template if `index_template_url` is configured and
+        the template can be retrieved, otherwise the fallback stub built from
+        `title` and `body_html`.
+        """
+        html_bytes = None
 
-        return response.text
+        if self.index_template_url:
+            html_bytes = self.read_index_template_bytes(verify=verify)
+
+        if html_bytes is None:
+            if not title and not body_html:
+                html_bytes = _DEFAULT_INDEX_HTML
+            else:
+                html_bytes = _fallback_index_html(title, body_html)
+
+        return html_bytes
 
     def write_index(
         self,
@@ -204,9 +644,9 @@ class DataDistributor:
         Create an `index.html` file in the given directory.
 
         If `index_template_url` is configured and a remote template is
-        successfully retrieved, that template is written as-is. Otherwise,
-        a simple fallback HTML stub is generated using the provided `title`
-        and `body_html` parameters.
+        successfully retrieved, its bytes are written as-is, without decoding
+        or re-encoding. Otherwise, a simple fallback HTML stub is generated
+        using the provided `title` and `body_html` parameters.
 
         Parameters
         ----------
@@ -220,7 +660,7 @@ class DataDistributor:
             Ignored if a remote template is successfully fetched.
         verify : bool or str or None, optional
             SSL certificate verification setting passed through to
-            `read_index_template`. If None, default rules of that method
+            `read_index_template_bytes`. If None, default rules of that method
             apply (i.e., treated as verify=True).
 
         Returns
@@ -228,32 +668,8 @@ class DataDistributor:
         pathlib.Path
             Path object pointing to the created `index.html` file.
         """
-        html = None
-
-        if self.index_template_url:
-            html = self.read_index_template(verify=verify)
-
-        if html is None:
-            title = title or "Data"
-            body_html = body_html or (
-                "<h1>Data Placeholder</h1>\n"
-                "<p>This page was automatically generated.</p>\n"
-            )
-            html = f"""<!DOCTYPE html>
-<html lang="en">
-  <head>
-    <meta charset="utf-8">
-    <meta name="robots" content="noindex, nofollow">
-    <title>{title}</title>
-  </head>
-  <body>
-{body_html}
-  </body>
-</html>
-"""
-
         index_path = directory / "index.html"
-        index_path.write_text(html, encoding="utf-8")
+        _write_bytes(index_path, self._index_html(title, body_html, verify))
         return index_path
 
     def create(
@@ -267,8 +683,8 @@ class DataDistributor:
         """
         Create a new data distribution.
 
-        This method generates a random slug, creates the associated data
-        directory, optionally writes an index file, and returns the slug,
+        This method generates a random unused slug, creates the associated
+        data directory, optionally writes an index file, and returns the slug,
         the directory path, and the public URL.
 
         Parameters
@@ -289,7 +705,7 @@ class DataDistributor:
         tuple[str, pathlib.Path, str]
             (slug, path, url)
         """
-        slug = self.make_slug(length)
+        slug = self.make_slug_unique(length)
         path = self.create_data_dir(slug)
 
         if with_index:
@@ -301,6 +717,52 @@ class DataDistributor:
         url = self.create_data_url(slug)
         return slug, path, url
 
+    def create_many(
+        self,
+        n: int,
+        length: int | None = None,
+        *,
+        with_index: bool = False,
+        index_title: str | None = None,
+        index_body_html: str | None = None,
+    ) -> list[tuple[str, Path, str]]:
+        """
+        Create several new data distributions in one call.
+
+        Each distribution is created exactly as by `create`. When
+        `with_index` is True the index template is downloaded at most once
+        for the whole batch and reused through the instance's template cache.
+
+        Parameters
+        ----------
+        n : int
+            Number of distributions to create.
+        length : int or None, optional
+            Optional override for the slug length. If None, `self.slug_length`
+            is used.
+        with_index : bool, optional
+            If True, an `index.html` is created in each new directory.
+        index_title : str or None, optional
+            Title for the fallback `index.html` stub (used only if no remote
+            template is fetched).
+        index_body_html : str or None, optional
+            Body HTML for the fallback `index.html` stub.
+
+        Returns
+        -------
+        list[tuple[str, pathlib.Path, str]]
+            One (slug, path, url) tuple per created distribution.
+        """
+        return [
+            self.create(
+                length,
+                with_index=with_index,
+                index_title=index_title,
+                index_body_html=index_body_html,
+            )
+            for _ in range(n)
+        ]
+
     def url_exists(
         self,
         slug: str,
@@ -310,9 +772,19 @@ class DataDistributor:
         """
         Check whether the URL corresponding to a slug is reachable.
 
-        The method first tries an HTTP HEAD request. If this fails or is not
-        supported, it falls back to an HTTP GET request. A response is
-        considered successful if its status code is less than 400.
+        The method first tries an HTTP HEAD request. Only if the server
+        reports that HEAD is not supported (405 or 501) does it fall back to a
+        streamed HTTP GET whose body is never read. A response is considered
+        successful if its status code is less than 400; any network error
+        results in False without a second attempt.
+
+        If a connection to the host of `base_url` cannot be established
+        (connection refused, DNS failure, connect timeout), the host is
+        considered unreachable for 30 seconds: further checks against it,
+        from any instance, return False immediately without issuing a
+        request. SSL errors, read timeouts, and other request failures do not
+        mark the host as unreachable, since they may depend on the URL or the
+        `verify` setting rather than the host.
 
         Parameters
         ----------
@@ -333,34 +805,246 @@ class DataDistributor:
         bool
             True if the URL returns an HTTP status < 400, else False.
         """
+        import requests
+
         url = self.create_data_url(slug)
 
         if verify is None:
             verify = True
 
+        if time.monotonic() < self._host_dead_until.get(self._netloc, 0.0):
+            return False
+
         try:
-            r = requests.head(
+            r = self._http().head(
                 url,
                 allow_redirects=True,
                 timeout=timeout,
                 verify=verify
             )
-            if r.status_code < 400:
-                return True
-        except requests.RequestException:
-            pass
-
-        try:
-            with requests.get(
-                url,
-                stream=True,
-                timeout=timeout,
-                verify=verify
-            ) as r:
-                return r.status_code < 400
-        except requests.RequestException:
+            status_code = r.status_code
+
+            if status_code in _HEAD_UNSUPPORTED:
+                with self._http().get(
+                    url,
+                    stream=True,
+                    timeout=timeout,
+                    verify=verify
+                ) as r:
+                    status_code = r.status_code
+        except requests.RequestException as exc:
+            if (
+                isinstance(exc, requests.ConnectionError)
+                and not isinstance(exc, requests.exceptions.SSLError)
+            ):
+                self._host_dead_until[self._netloc] = (
+                    time.monotonic() + _DEAD_HOST_TTL
+                )
             return False
 
+        self._host_dead_until.pop(self._netloc, None)
+        return status_code < 400
+
+    def url_exists_many(
+        self,
+        slugs: list[str],
+        timeout: float = 3.0,
+        verify: bool | str | None = None,
+        max_workers: int = 16,
+    ) -> list[bool]:
+        """
+        Check whether the URLs corresponding to several slugs are reachable.
+
+        Each slug is checked with `url_exists`, with up to `max_workers`
+        checks in flight at once over the instance's pooled session, so the
+        total wall time is close to that of a single check rather than the
+        sum of all of them.
+
+        Parameters
+        ----------
+        slugs : list[str]
+            The slugs whose URLs should be checked.
+        timeout : float, optional
+            Timeout in seconds for each HTTP request. Default is 3.0.
+        verify : bool or str or None, optional
+            SSL certificate verification setting passed through to
+            `url_exists`.
+        max_workers : int, optional
+            Maximum number of concurrent checks. Default is 16, matching the
+            size of the session's connection pool.
+
+        Returns
+        -------
+        list[bool]
+            Reachability of each slug, in the same order as `slugs`.
+        """
+        if not slugs:
+            return []
+
+        # Create the shared session up front rather than racing to create it
+        # from the worker threads.
+        self._http()
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(slugs))
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda slug: self.url_exists(slug, timeout, verify),
+                    slugs,
+                )
+            )
+
+
+class AsyncDataDistributor(DataDistributor):
+    """
+    `DataDistributor` with coroutine-based creation of distributions.
+
+    Directory creation and index writing run in worker threads via
+    `asyncio.to_thread`, so several creations can overlap their filesystem
+    and network work. All synchronous methods of `DataDistributor` remain
+    available.
+    """
+
+    __slots__ = ()
+
+    async def create_async(
+        self,
+        length: int | None = None,
+        *,
+        with_index: bool = False,
+        index_title: str | None = None,
+        index_body_html: str | None = None,
+    ) -> tuple[str, Path, str]:
+        """
+        Create a new data distribution without blocking the event loop.
+
+        Behaves like `create`, but the index template is fetched and the
+        directory and `index.html` are written in worker threads.
+
+        Parameters
+        ----------
+        length : int or None, optional
+            Optional override for the slug length. If None, `self.slug_length`
+            is used.
+        with_index : bool, optional
+            If True, an `index.html` is created via `write_index`.
+        index_title : str or None, optional
+            Title for the fallback `index.html` stub (used only if no remote
+            template is fetched).
+        index_body_html : str or None, optional
+            Body HTML for the fallback `index.html` stub.
+
+        Returns
+        -------
+        tuple[str, pathlib.Path, str]
+            (slug, path, url)
+        """
+        html_bytes = None
+        if with_index:
+            html_bytes = await self._index_html_async(
+                index_title, index_body_html
+            )
+
+        return await self._create_with_html(length, html_bytes)
+
+    async def create_many_async(
+        self,
+        n: int,
+        length: int | None = None,
+        *,
+        concurrency: int = 8,
+        with_index: bool = False,
+        index_title: str | None = None,
+        index_body_html: str | None = None,
+    ) -> list[tuple[str, Path, str]]:
+        """
+        Create several new data distributions concurrently.
+
+        At most `concurrency` creations are in flight at once. When
+        `with_index` is True, the `index.html` contents (the remote template,
+        or the fallback stub if the template cannot be retrieved) are
+        determined once before the batch starts and written to every new
+        directory, so the template is requested at most once per batch.
+
+        Parameters
+        ----------
+        n : int
+            Number of distributions to create.
+        length : int or None, optional
+            Optional override for the slug length. If None, `self.slug_length`
+            is used.
+        concurrency : int, optional
+            Maximum number of creations in progress at once. Default is 8.
+        with_index : bool, optional
+            If True, an `index.html` is created in each new directory.
+        index_title : str or None, optional
+            Title for the fallback `index.html` stub (used only if no remote
+            template is fetched).
+        index_body_html : str or None, optional
+            Body HTML for the fallback `index.html` stub.
+
+        Returns
+        -------
+        list[tuple[str, pathlib.Path, str]]
+            One (slug, path, url) tuple per created distribution.
+        """
+        html_bytes = None
+        if with_index:
+            html_bytes = await self._index_html_async(
+                index_title, index_body_html
+            )
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def create_one() -> tuple[str, Path, str]:
+            async with semaphore:
+                return await self._create_with_html(length, html_bytes)
+
+        return list(await asyncio.gather(*(create_one() for _ in range(n))))
+
+    async def _index_html_async(
+        self,
+        title: str | None,
+        body_html: str | None,
+    ) -> bytes:
+        """
+        Return the `index.html` contents, fetching the template in a thread.
+        """
+        if self.index_template_url:
+            # Create the shared session here, in the event loop thread, rather
+            # than racing to create it from the worker threads.
+            self._http()
+
+        # Verification is disabled to match `create`.
+        return await asyncio.to_thread(
+            self._index_html,
+            title,
+            body_html,
+            verify=False,
+        )
+
+    async def _create_with_html(
+        self,
+        length: int | None,
+        html_bytes: bytes | None,
+    ) -> tuple[str, Path, str]:
+        """
+        Create a distribution, writing `html_bytes` as its `index.html`.
+
+        No `index.html` is written if `html_bytes` is None.
+        """
+        slug = self.make_slug_unique(length)
+        path = await asyncio.to_thread(self.create_data_dir, slug)
+
+        if html_bytes is not None:
+            await asyncio.to_thread(
+                _write_bytes, path / "index.html", html_bytes
+            )
+
+        url = self.create_data_url(slug)
+        return slug, path, url
+
 
 def create_data_distribution(
         base_directory: Path | str,
@@ -435,30 +1119,3 @@ def create_data_distribution(
     )
 
     return distributor, slug, path, url
-
-
-
-if __name__ == "__main__":
-    base_directory = "/home/cnspci/public_html/tmp/imagine_rit"
-    base_url = "https://home.cis.rit.edu/~cnspci/tmp/imagine_rit"
-    index_template_url = \
-        "https://home.cis.rit.edu/~cnspci/tmp/imagine_rit/template/index.html"
-
-    distributor = DataDistributor(
-        base_directory=base_directory,
-        base_url=base_url,
-        index_template_url=index_template_url,
-        suppress_insecure_warning=False
-    )
-
-    slug, path, url = distributor.create(with_index=True)
-
-    print("Slug:")
-    print(slug)
-    print("Directory:")
-    print(path)
-    print("URL:")
-    print(url)
-    print("URL reachable?")
-    print(distributor.url_exists(slug, verify=False))
-
@@ -1 +1 @@
-from .DataDistributor import DataDistributor
+from .DataDistributor import AsyncDataDistributor, DataDistributor
@@ -0,0 +1,27 @@
+from .DataDistributor import DataDistributor
+
+
+if __name__ == "__main__":
+    base_directory = "/home/cnspci/public_html/tmp/imagine_rit"
+    base_url = "https://home.cis.rit.edu/~cnspci/tmp/imagine_rit"
+    index_template_url = \
+        "https://home.cis.rit.edu/~cnspci/tmp/imagine_rit/template/index.html"
+
+    distributor = DataDistributor(
+        base_directory=base_directory,
+        base_url=base_url,
+        index_template_url=index_template_url,
+        suppress_insecure_warning=False
+    )
+
+    slug, path, url = distributor.create(with_index=True)
+
+    print("Slug:")
+    print(slug)
+    print("Directory:")
+    print(path)
+    print("URL:")
+    print(url)
+    print("URL reachable?")
+    print(distributor.url_exists(slug, verify=False))
+